@@ -29,11 +29,38 @@ def create_app(config_name="development"):
     app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=1)
     app.config["JWT_REFRESH_TOKEN_EXPIRES"] = timedelta(days=30)
     
+    # Batch endpoint configuration
+    app.config["BATCH_MAX_REQUESTS"] = 20
+    
+    # Activity tracking configuration
+    app.config["ACTIVITY_FLUSH_INTERVAL"] = 30  # Seconds between batched timestamp writes
+    app.config["ACTIVITY_MAX_PENDING"] = 1000  # Flush early once this many users are buffered
+    
+    # Response compression and caching configuration
+    app.config["COMPRESS_MIN_SIZE"] = 1024  # Bytes; smaller bodies are sent as-is
+    app.config["COMPRESS_LEVEL"] = 6
+    app.config["RESPONSE_CACHE_MAX_BYTES"] = 32 * 1024 * 1024
+    app.config["RESPONSE_CACHE_TTL"] = 60  # Seconds; bounds staleness across workers
+    
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     jwt.init_app(app)
     
+    from app.services.activity_service import activity_tracker
+    activity_tracker.init_app(app)
+    
+    from app.services.stats_service import register_stat_hooks
+    register_stat_hooks()
+    
+    from app.utils.compression import register_compression
+    from app.utils.cache import response_cache
+    register_compression(app)
+    response_cache.init_app(app)
+    
+    from app.commands import register_commands
+    register_commands(app)
+    
     # Debug endpoint to verify JWT configuration
     @app.route('/api/test-jwt')
     @jwt_required()
@@ -44,8 +71,12 @@ def create_app(config_name="development"):
     # Register blueprints
     from app.api.users import blp as users_blp
     from app.api.auth import blp as auth_blp
+    from app.api.batch import blp as batch_blp
+    from app.api.admin import blp as admin_blp
     api.register_blueprint(users_blp, url_prefix="/api/users")
     api.register_blueprint(auth_blp, url_prefix="/api/auth")
+    api.register_blueprint(batch_blp, url_prefix="/api/batch")
+    api.register_blueprint(admin_blp, url_prefix="/api/admin")
     
     return app
 
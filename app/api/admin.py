@@ -0,0 +1,47 @@
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+from app.models.user import User
+from app.schemas.stats import UserStatsSchema, SignupStatsArgsSchema, SignupStatsSchema, ActivityStatsSchema
+from app.services.activity_service import activity_tracker
+from app.services.stats_service import get_counters, get_signups_per_day
+
+blp = Blueprint("admin", "admin", description="Admin analytics")
+
+def _require_admin():
+    current_user = User.query.get_or_404(int(get_jwt_identity()))
+    if not current_user.is_admin():
+        abort(403, message="Admin access required")
+
+@blp.route("/stats/users")
+class UserStats(MethodView):
+    @jwt_required()
+    @blp.response(200, UserStatsSchema)
+    def get(self):
+        """Get user counts by role and status (admin only)"""
+        _require_admin()
+        return {
+            'total': get_counters('users').get('total', 0),
+            'by_role': get_counters('users_by_role'),
+            'by_status': get_counters('users_by_status'),
+        }
+
+@blp.route("/stats/signups")
+class SignupStats(MethodView):
+    @jwt_required()
+    @blp.arguments(SignupStatsArgsSchema, location="query")
+    @blp.response(200, SignupStatsSchema)
+    def get(self, args):
+        """Get signups per day (admin only)"""
+        _require_admin()
+        return {'signups_per_day': get_signups_per_day(args['days'])}
+
+@blp.route("/stats/activity")
+class ActivityStats(MethodView):
+    @jwt_required()
+    @blp.response(200, ActivityStatsSchema)
+    def get(self):
+        """Get activity tracker flush metrics (admin only)"""
+        _require_admin()
+        return activity_tracker.metrics()
@@ -22,6 +22,7 @@ class Login(MethodView):
         user = User.query.filter_by(email=auth_data['email']).first()
         
         if user and user.verify_password(auth_data['password']):
+            user.update_last_login()
             # Convert user.id to string when creating tokens
             access_token = create_access_token(identity=str(user.id))
             refresh_token = create_refresh_token(identity=str(user.id))
@@ -0,0 +1,115 @@
+import sys
+from contextlib import contextmanager
+
+from flask import current_app, g, request
+from flask.views import MethodView
+from flask_smorest import Blueprint, abort
+from flask_jwt_extended import jwt_required
+from sqlalchemy.exc import SQLAlchemyError
+from werkzeug.exceptions import InternalServerError
+
+from app.schemas.batch import BatchRequestSchema, BatchResponseSchema
+from app import db
+
+blp = Blueprint("batch", "batch", description="Run several API calls in one round trip")
+
+@contextmanager
+def _deferred_commits(session):
+    """Turn handler commits into flushes so the whole batch commits once.
+
+    Yields a dict whose 'rolled_back' flag is set when a handler rolls the
+    session back, since that also discards earlier sub-requests' writes.
+    """
+    state = {'rolled_back': False}
+
+    def rollback():
+        state['rolled_back'] = True
+        type(session).rollback(session)
+
+    session.commit = session.flush
+    session.rollback = rollback
+    try:
+        yield state
+    finally:
+        del session.commit
+        del session.rollback
+
+def _dispatch(item):
+    """Run one sub-request through the app's URL map and return (status, body)"""
+    headers = {}
+    if 'Authorization' in request.headers:
+        headers['Authorization'] = request.headers['Authorization']
+
+    # The nested request context reuses the current app context, so the
+    # database session (and its identity map) is shared across sub-requests.
+    with current_app.test_request_context(item['path'], method=item['method'],
+                                          json=item.get('body'), headers=headers):
+        try:
+            response = current_app.full_dispatch_request()
+        except Exception as e:
+            # Build the 500 here: handle_exception re-raises when
+            # PROPAGATE_EXCEPTIONS is set, which would fail the whole batch.
+            current_app.log_exception(sys.exc_info())
+            response = current_app.finalize_request(
+                current_app.handle_http_exception(InternalServerError(original_exception=e)),
+                from_error_handler=True,
+            )
+        body = response.get_json(silent=True)
+        if body is None and response.status_code != 204:
+            body = response.get_data(as_text=True) or None
+        return response.status_code, body
+
+def _succeeded(status):
+    """Only 2xx counts; a redirect means the sub-request was not handled"""
+    return 200 <= status < 300
+
+@blp.route("/")
+class Batch(MethodView):
+    @jwt_required()
+    @blp.arguments(BatchRequestSchema)
+    @blp.response(200, BatchResponseSchema)
+    def post(self, batch_data):
+        """Run a list of API sub-requests and return all responses together"""
+        items = batch_data['requests']
+        if len(items) > current_app.config['BATCH_MAX_REQUESTS']:
+            abort(400, message=f"A batch may contain at most {current_app.config['BATCH_MAX_REQUESTS']} requests")
+        # Sub-requests share the app context and therefore g, so a batch
+        # reached from inside another one (under any spelling of the URL) sees
+        # the flag and is rejected.
+        if g.get('_batch_active'):
+            abort(400, message="Batches cannot be nested")
+
+        g._batch_active = True
+        try:
+            return self._run(batch_data)
+        finally:
+            g.pop('_batch_active', None)
+
+    def _run(self, batch_data):
+        items = batch_data['requests']
+        if not batch_data['transactional']:
+            responses = []
+            for item in items:
+                status, body = _dispatch(item)
+                responses.append({'status': status, 'body': body})
+            return {'responses': responses, 'committed': True}
+
+        session = db.session()
+        responses = []
+        with _deferred_commits(session) as state:
+            for item in items:
+                status, body = _dispatch(item)
+                responses.append({'status': status, 'body': body})
+                if not _succeeded(status) or state['rolled_back']:
+                    break
+
+        if not _succeeded(responses[-1]['status']) or state['rolled_back']:
+            db.session.rollback()
+            return {'responses': responses, 'committed': False}
+
+        try:
+            db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            abort(500, message=str(e))
+        return {'responses': responses, 'committed': True}
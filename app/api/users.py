@@ -1,23 +1,59 @@
+from functools import lru_cache
+
+from flask import jsonify
 from flask.views import MethodView
 from flask_smorest import Blueprint, abort
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm import load_only
 
 from app.models.user import User
-from app.schemas.user import UserSchema, UserCreateSchema, UserUpdateSchema, PaginationSchema
+from app.schemas.user import UserSchema, UserCreateSchema, UserUpdateSchema, UserFieldsSchema, UserListArgsSchema
+from app.utils.cache import response_cache
 from app import db
 
 blp = Blueprint("users", "users", description="Operations on users")
 
+# Schema fields backed by hybrids rather than columns, mapped to the columns they read
+DERIVED_FIELD_COLUMNS = {
+    'full_name': ('first_name', 'last_name'),
+}
+
+def _user_columns(only):
+    """Resolve requested schema fields to the User columns needed to dump them"""
+    columns = set()
+    for field in only:
+        columns.update(DERIVED_FIELD_COLUMNS.get(field, (field,)))
+    return [getattr(User, column) for column in sorted(columns)]
+
+@lru_cache(maxsize=64)
+def _user_schema(only, many=False):
+    """Return a shared UserSchema restricted to a field set"""
+    return UserSchema(only=only, many=many)
+
+def _user_query(only):
+    """User query loading only the columns needed for the requested fields"""
+    if not only:
+        return User.query
+    return User.query.options(load_only(*_user_columns(only)))
+
+def _dump_users(users, only, many=False):
+    """Serialize users with a sparse fieldset, or return them as-is for the default schema"""
+    if not only:
+        return users
+    return jsonify(_user_schema(tuple(sorted(set(only))), many=many).dump(users))
+
 @blp.route("/me")
 class CurrentUser(MethodView):
     @jwt_required()
+    @blp.arguments(UserFieldsSchema, location="query")
     @blp.response(200, UserSchema)
-    def get(self):
+    def get(self, field_args):
         """Get current user's profile"""
+        only = field_args.get('only')
         user_id = int(get_jwt_identity())  # Convert string ID back to integer
-        user = User.query.get_or_404(user_id)
-        return user
+        user = _user_query(only).get_or_404(user_id)
+        return _dump_users(user, only)
 
     @jwt_required()
     @blp.arguments(UserUpdateSchema)
@@ -36,6 +72,7 @@ class CurrentUser(MethodView):
             if 'password' in user_data:
                 user.set_password(user_data['password'])
             
+            response_cache.invalidate_on_commit('users')
             db.session.commit()
             return user
         except IntegrityError:
@@ -48,7 +85,8 @@ class CurrentUser(MethodView):
 @blp.route("/")
 class UserList(MethodView):
     @jwt_required()
-    @blp.arguments(PaginationSchema, location="query")
+    @response_cache.cached(tags=('users',))
+    @blp.arguments(UserListArgsSchema, location="query")
     @blp.response(200, UserSchema(many=True))
     def get(self, pagination_args):
         """Get all users (admin only)"""
@@ -58,7 +96,9 @@ class UserList(MethodView):
         
         page = pagination_args.get('page', 1)
         per_page = pagination_args.get('per_page', 20)
-        return User.query.paginate(page=page, per_page=per_page, error_out=False).items
+        only = pagination_args.get('only')
+        users = _user_query(only).paginate(page=page, per_page=per_page, error_out=False).items
+        return _dump_users(users, only, many=True)
 
     @jwt_required()
     @blp.arguments(UserCreateSchema)
@@ -81,6 +121,7 @@ class UserList(MethodView):
             user.password = user_data['password']
             
             db.session.add(user)
+            response_cache.invalidate_on_commit('users')
             db.session.commit()
             
             return user, 201
@@ -94,23 +135,25 @@ class UserList(MethodView):
 @blp.route("/<int:user_id>")
 class UserView(MethodView):
     @jwt_required()
+    @blp.arguments(UserFieldsSchema, location="query")
     @blp.response(200, UserSchema)
-    def get(self, user_id):
+    def get(self, field_args, user_id):
         """Get specific user"""
-        current_user = User.query.get_or_404(get_jwt_identity())
+        current_user = User.query.get_or_404(int(get_jwt_identity()))
         
         if not current_user.is_admin() and current_user.id != user_id:
             abort(403, message="Access denied")
         
-        user = User.query.get_or_404(user_id)
-        return user
+        only = field_args.get('only')
+        user = _user_query(only).get_or_404(user_id)
+        return _dump_users(user, only)
 
     @jwt_required()
     @blp.arguments(UserUpdateSchema)
     @blp.response(200, UserSchema)
     def put(self, user_data, user_id):
         """Update specific user (admin only)"""
-        current_user = User.query.get_or_404(get_jwt_identity())
+        current_user = User.query.get_or_404(int(get_jwt_identity()))
         
         if not current_user.is_admin():
             abort(403, message="Admin access required")
@@ -125,6 +168,7 @@ class UserView(MethodView):
             if 'password' in user_data:
                 user.password = user_data['password']
             
+            response_cache.invalidate_on_commit('users')
             db.session.commit()
             return user
         except IntegrityError:
@@ -138,7 +182,7 @@ class UserView(MethodView):
     @blp.response(204)
     def delete(self, user_id):
         """Delete specific user (admin only)"""
-        current_user = User.query.get_or_404(get_jwt_identity())
+        current_user = User.query.get_or_404(int(get_jwt_identity()))
         
         if not current_user.is_admin():
             abort(403, message="Admin access required")
@@ -147,6 +191,7 @@ class UserView(MethodView):
         
         try:
             db.session.delete(user)
+            response_cache.invalidate_on_commit('users')
             db.session.commit()
             return '', 204
         except SQLAlchemyError as e:
@@ -0,0 +1,40 @@
+# /backend/app/commands.py
+
+import click
+
+def register_commands(app):
+    """Register CLI commands on the application.
+
+    They live here rather than in app.py because `flask --app app.py`
+    imports the app package, so commands declared in app.py are never seen.
+    """
+
+    @app.cli.command("init-db")
+    def init_db():
+        """Initialize the database with tables and initial data."""
+        from app import db
+        from app.services.stats_service import reconcile_stats
+        db.create_all()
+        # Counters for rows that existed before stat_counter was created
+        reconcile_stats()
+        print("Initialized the database.")
+
+    @app.cli.command("seed-db")
+    @click.option("--users", default=1000, show_default=True, help="Number of users to create.")
+    @click.option("--seed", default=0, show_default=True, help="Random seed for deterministic data.")
+    @click.option("--batch-size", default=10000, show_default=True, help="Rows per bulk insert batch.")
+    def seed_db(users, seed, batch_size):
+        """Seed the database with sample data."""
+        from app.utils.seeder import seed_database
+        stats = seed_database(users=users, seed=seed, batch_size=batch_size)
+        for table, result in stats.items():
+            print(f"{table}: {result['rows']} rows in {result['seconds']:.1f}s "
+                  f"({result['rows_per_second']:.0f} rows/sec)")
+        print("Database seeded with sample data.")
+
+    @app.cli.command("reconcile-stats")
+    def reconcile_stats():
+        """Recompute admin statistics counters from the source tables."""
+        from app.services.stats_service import reconcile_stats
+        corrected = reconcile_stats()
+        print(f"Reconciled statistics, {corrected} counters corrected.")
@@ -5,6 +5,7 @@ from app import db
 
 # Import models to make them available when importing the package
 from app.models.user import User
+from app.models.stat_counter import StatCounter
 # from app.models.course import Course
 # from app.models.class_ import Class
 # from app.models.enrollment import Enrollment
@@ -0,0 +1,15 @@
+# /backend/app/models/stat_counter.py
+
+from app import db
+
+class StatCounter(db.Model):
+    """Incrementally maintained counter backing the admin statistics"""
+
+    __tablename__ = 'stat_counter'
+
+    name = db.Column(db.String(50), primary_key=True)
+    key = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f'<StatCounter {self.name}:{self.key}={self.value}>'
@@ -4,6 +4,7 @@ from app import db
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm.attributes import set_committed_value
 
 class User(db.Model):
     """User model for authentication and profile management"""
@@ -13,12 +14,17 @@ class User(db.Model):
     password_hash = db.Column(db.String(256), nullable=False)
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
-    role = db.Column(db.String(20), nullable=False, default='student')
+    # active_history loads the old value on change, even if it was expired,
+    # so the statistics hooks can move counters between buckets
+    role = db.column_property(db.Column(db.String(20), nullable=False, default='student'),
+                              active_history=True)
     theme_preference = db.Column(db.String(20), default='light')
     profile_image = db.Column(db.String(255))
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.column_property(db.Column(db.DateTime, default=datetime.utcnow),
+                                    active_history=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    is_active = db.Column(db.Boolean, default=True, nullable=False)
+    is_active = db.column_property(db.Column(db.Boolean, default=True, nullable=False),
+                                   active_history=True)
     last_login = db.Column(db.DateTime)
 
     @property
@@ -40,8 +46,12 @@ class User(db.Model):
         return f"{self.first_name} {self.last_name}"
 
     def update_last_login(self):
-        self.last_login = datetime.utcnow()
-        db.session.commit()
+        # Buffered by the activity tracker instead of committing here, so a
+        # login does not become its own write transaction.
+        from app.services.activity_service import activity_tracker
+        timestamp = datetime.utcnow()
+        set_committed_value(self, 'last_login', timestamp)
+        activity_tracker.record(self.id, 'last_login', timestamp)
 
     def to_dict(self):
         return {
@@ -0,0 +1,27 @@
+from marshmallow import Schema, fields, validate
+
+class BatchItemSchema(Schema):
+    """Schema for a single sub-request inside a batch"""
+    method = fields.Str(load_default='GET',
+                        validate=validate.OneOf(['GET', 'POST', 'PUT', 'PATCH', 'DELETE']),
+                        description="HTTP method of the sub-request")
+    path = fields.Str(required=True, validate=validate.Regexp(r'^/api/'),
+                      description="Absolute API path, optionally with a query string")
+    body = fields.Raw(allow_none=True, description="JSON body of the sub-request")
+
+class BatchRequestSchema(Schema):
+    """Schema for a batch of sub-requests"""
+    requests = fields.List(fields.Nested(BatchItemSchema), required=True,
+                           validate=validate.Length(min=1))
+    transactional = fields.Bool(load_default=False,
+                                description="Commit all writes together or none at all")
+
+class BatchItemResponseSchema(Schema):
+    """Schema for the result of a single sub-request"""
+    status = fields.Int(required=True)
+    body = fields.Raw(allow_none=True)
+
+class BatchResponseSchema(Schema):
+    """Schema for the batch response"""
+    responses = fields.List(fields.Nested(BatchItemResponseSchema))
+    committed = fields.Bool(description="Whether the writes of the batch were committed")
@@ -0,0 +1,26 @@
+from marshmallow import Schema, fields, validate
+
+class UserStatsSchema(Schema):
+    """Schema for user statistics"""
+    total = fields.Int(description="Total number of users")
+    by_role = fields.Dict(keys=fields.Str(), values=fields.Int(), description="User count per role")
+    by_status = fields.Dict(keys=fields.Str(), values=fields.Int(), description="Active and inactive user counts")
+
+class SignupStatsArgsSchema(Schema):
+    """Schema for signup statistics parameters"""
+    days = fields.Int(load_default=30, validate=validate.Range(min=1, max=366))
+
+class SignupStatsSchema(Schema):
+    """Schema for signups per day"""
+    signups_per_day = fields.Dict(keys=fields.Str(), values=fields.Int(),
+                                  description="Signup count per ISO date, oldest first")
+
+class ActivityStatsSchema(Schema):
+    """Schema for activity tracker metrics"""
+    pending = fields.Int()
+    pending_age_seconds = fields.Float()
+    last_flush_lag_seconds = fields.Float()
+    last_batch_size = fields.Int()
+    seconds_since_last_flush = fields.Float(allow_none=True)
+    total_flushed = fields.Int()
+    flush_count = fields.Int()
@@ -1,4 +1,5 @@
 from marshmallow import Schema, fields, validate
+from webargs.fields import DelimitedList
 
 class UserSchema(Schema):
     id = fields.Int(dump_only=True)
@@ -8,6 +9,7 @@ class UserSchema(Schema):
     role = fields.Str(validate=validate.OneOf(['admin', 'student']), load_default='student')
     theme_preference = fields.Str(validate=validate.OneOf(['light', 'dark']), load_default='light')
     profile_image = fields.Str()
+    full_name = fields.Str(dump_only=True)
     created_at = fields.DateTime(dump_only=True)
     updated_at = fields.DateTime(dump_only=True)
 
@@ -38,6 +40,15 @@ class PaginationSchema(Schema):
     page = fields.Int(missing=1, validate=validate.Range(min=1))
     per_page = fields.Int(missing=20, validate=validate.Range(min=1, max=100))
 
+class UserFieldsSchema(Schema):
+    """Schema for sparse fieldset parameters"""
+    only = DelimitedList(fields.Str(validate=validate.OneOf(list(UserSchema._declared_fields))),
+                         data_key="fields",
+                         description="Comma-separated list of user fields to return, e.g. id,email,full_name")
+
+class UserListArgsSchema(PaginationSchema, UserFieldsSchema):
+    """Schema for user list query parameters"""
+
 class AuthSchema(Schema):
     """Schema for login credentials"""
     email = fields.Email(required=True, description="User's email address")
@@ -0,0 +1,169 @@
+# /backend/app/services/activity_service.py
+
+import atexit
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy import bindparam
+
+from app import db
+
+
+class ActivityTracker:
+    """Write-behind buffer for user activity timestamps.
+
+    Timestamps are kept in memory and written in one executemany per column
+    every ``ACTIVITY_FLUSH_INTERVAL`` seconds, or sooner once
+    ``ACTIVITY_MAX_PENDING`` users are waiting. Pending writes are flushed at
+    interpreter shutdown, so at most one interval of activity is lost on a crash.
+    """
+
+    # User columns that may be written through the tracker
+    COLUMNS = ('last_login',)
+
+    def __init__(self, app=None):
+        self._app = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {column: {} for column in self.COLUMNS}
+        self._oldest_pending = None
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self._last_flush_at = None
+        self._last_flush_lag = 0.0
+        self._last_batch_size = 0
+        self._total_flushed = 0
+        self._flush_count = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('ACTIVITY_FLUSH_INTERVAL', 30)
+        app.config.setdefault('ACTIVITY_MAX_PENDING', 1000)
+        app.extensions['activity_tracker'] = self
+        if self._app is None:
+            atexit.register(self.shutdown)
+        self._app = app
+
+    def record(self, user_id, column='last_login', timestamp=None):
+        """Buffer a timestamp for a user; the newest value per user wins"""
+        if column not in self._pending:
+            raise ValueError(f'Unknown activity column: {column}')
+        timestamp = timestamp or datetime.utcnow()
+
+        with self._lock:
+            pending = self._pending[column]
+            if user_id not in pending or pending[user_id] < timestamp:
+                pending[user_id] = timestamp
+            if self._oldest_pending is None:
+                self._oldest_pending = time.monotonic()
+            size = sum(len(rows) for rows in self._pending.values())
+
+        self._ensure_worker()
+        if size >= self._app.config['ACTIVITY_MAX_PENDING']:
+            self._wake.set()
+
+    def flush(self):
+        """Write all buffered timestamps and return the number of rows written"""
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending
+                oldest = self._oldest_pending
+                self._pending = {column: {} for column in self.COLUMNS}
+                self._oldest_pending = None
+
+            batch_size = sum(len(rows) for rows in pending.values())
+            if not batch_size:
+                # Nothing written, so keep the metrics of the last real flush
+                return 0
+            try:
+                self._write(pending)
+            except Exception:
+                self._requeue(pending, oldest)
+                raise
+
+            now = time.monotonic()
+            self._last_flush_at = now
+            self._last_flush_lag = now - oldest
+            self._last_batch_size = batch_size
+            self._total_flushed += batch_size
+            self._flush_count += 1
+            return batch_size
+
+    def metrics(self):
+        """Return flush lag and batch size figures"""
+        with self._lock:
+            pending = sum(len(rows) for rows in self._pending.values())
+            oldest = self._oldest_pending
+        now = time.monotonic()
+        return {
+            'pending': pending,
+            'pending_age_seconds': now - oldest if oldest is not None else 0.0,
+            'last_flush_lag_seconds': self._last_flush_lag,
+            'last_batch_size': self._last_batch_size,
+            'seconds_since_last_flush': now - self._last_flush_at if self._last_flush_at is not None else None,
+            'total_flushed': self._total_flushed,
+            'flush_count': self._flush_count,
+        }
+
+    def shutdown(self):
+        """Stop the background worker and flush what is left"""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self._app is not None:
+            self.flush()
+
+    def _write(self, pending):
+        # Use a dedicated connection so a flush never commits or rolls back
+        # whatever the current request has pending on db.session.
+        table = db.Model.metadata.tables['user']
+        with self._app.app_context():
+            with db.engine.begin() as connection:
+                for column, rows in pending.items():
+                    if not rows:
+                        continue
+                    statement = (
+                        table.update()
+                        .where(table.c.id == bindparam('user_id'))
+                        .values({column: bindparam('timestamp')})
+                    )
+                    connection.execute(statement, [
+                        {'user_id': user_id, 'timestamp': timestamp}
+                        for user_id, timestamp in rows.items()
+                    ])
+
+    def _requeue(self, pending, oldest):
+        with self._lock:
+            for column, rows in pending.items():
+                current = self._pending[column]
+                for user_id, timestamp in rows.items():
+                    if user_id not in current or current[user_id] < timestamp:
+                        current[user_id] = timestamp
+            if oldest is not None and (self._oldest_pending is None or oldest < self._oldest_pending):
+                self._oldest_pending = oldest
+
+    def _ensure_worker(self):
+        if self._thread is not None or self._stopped:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='activity-flush', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self._app.config['ACTIVITY_FLUSH_INTERVAL'])
+            self._wake.clear()
+            if self._stopped:
+                break
+            try:
+                self.flush()
+            except Exception:
+                self._app.logger.exception('Failed to flush user activity')
+
+
+activity_tracker = ActivityTracker()
@@ -0,0 +1,181 @@
+# /backend/app/services/stats_service.py
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, func, inspect
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models.user import User
+from app.models.stat_counter import StatCounter
+
+# Counter names maintained from User rows
+USER_STATS = ('users', 'users_by_role', 'users_by_status', 'signups_per_day')
+
+
+def _user_buckets(role, is_active, created_at):
+    """Return the (name, key) counters a user with these values contributes to"""
+    created_at = created_at or datetime.utcnow()
+    return [
+        ('users', 'total'),
+        ('users_by_role', role),
+        ('users_by_status', 'active' if is_active else 'inactive'),
+        ('signups_per_day', created_at.date().isoformat()),
+    ]
+
+
+def _previous_value(state, attr):
+    # The counted columns use active_history, so the old value is loaded
+    # into history even when it had been expired before the change.
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(state.object, attr)
+
+
+def _upsert(connection, table, name, key, delta):
+    """Add delta to a counter with a single atomic upsert statement"""
+    dialect = connection.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect in ('mysql', 'mariadb'):
+        from sqlalchemy.dialects.mysql import insert
+        statement = insert(table).values(name=name, key=key, value=delta)
+        connection.execute(statement.on_duplicate_key_update(value=table.c.value + statement.inserted.value))
+        return True
+    else:
+        return False
+
+    statement = insert(table).values(name=name, key=key, value=delta)
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[table.c.name, table.c.key],
+        set_={'value': table.c.value + statement.excluded.value},
+    ))
+    return True
+
+
+def _apply_deltas(connection, deltas):
+    """Add deltas to counters inside the flush's own transaction"""
+    table = StatCounter.__table__
+    for (name, key), delta in deltas.items():
+        if not delta:
+            continue
+        if _upsert(connection, table, name, key, delta):
+            continue
+        # Dialects without upsert: update, then insert inside a savepoint and
+        # fall back to the update if a concurrent transaction inserted first.
+        update = (
+            table.update()
+            .where(table.c.name == name, table.c.key == key)
+            .values(value=table.c.value + delta)
+        )
+        if connection.execute(update).rowcount:
+            continue
+        try:
+            with connection.begin_nested():
+                connection.execute(table.insert().values(name=name, key=key, value=delta))
+        except IntegrityError:
+            connection.execute(update)
+
+
+def _after_user_insert(mapper, connection, target):
+    deltas = Counter(_user_buckets(target.role, target.is_active, target.created_at))
+    _apply_deltas(connection, deltas)
+
+
+def _after_user_update(mapper, connection, target):
+    state = inspect(target)
+    old = _user_buckets(_previous_value(state, 'role'),
+                        _previous_value(state, 'is_active'),
+                        _previous_value(state, 'created_at'))
+    new = _user_buckets(target.role, target.is_active, target.created_at)
+    if old == new:
+        return
+    deltas = Counter(new)
+    deltas.subtract(old)
+    _apply_deltas(connection, deltas)
+
+
+def _after_user_delete(mapper, connection, target):
+    deltas = Counter()
+    deltas.subtract(_user_buckets(target.role, target.is_active, target.created_at))
+    _apply_deltas(connection, deltas)
+
+
+def register_stat_hooks():
+    """Attach the counter maintenance hooks to the User mapper"""
+    hooks = [
+        ('after_insert', _after_user_insert),
+        ('after_update', _after_user_update),
+        ('after_delete', _after_user_delete),
+    ]
+    for identifier, fn in hooks:
+        if not event.contains(User, identifier, fn):
+            event.listen(User, identifier, fn)
+
+
+def reconcile_stats():
+    """
+    Recompute the counters from the source tables and overwrite drifted values.
+
+    Rows written without the ORM (bulk seeding, manual SQL) bypass the hooks,
+    so this is meant to run periodically, e.g. from cron via `flask reconcile-stats`.
+
+    Buckets without rows count as 0, so counters that dropped to 0 are kept
+    and not reported as drift.
+
+    Returns:
+        int: Number of counters whose value was wrong
+    """
+    expected = Counter()
+    expected[('users', 'total')] = db.session.query(func.count(User.id)).scalar()
+    for role, count in db.session.query(User.role, func.count(User.id)).group_by(User.role):
+        expected[('users_by_role', role)] = count
+    for is_active, count in db.session.query(User.is_active, func.count(User.id)).group_by(User.is_active):
+        expected[('users_by_status', 'active' if is_active else 'inactive')] = count
+    day = func.date(User.created_at)
+    for created_on, count in db.session.query(day, func.count(User.id)).group_by(day):
+        if created_on is not None:
+            expected[('signups_per_day', str(created_on))] = count
+
+    current = {
+        (counter.name, counter.key): counter
+        for counter in StatCounter.query.filter(StatCounter.name.in_(USER_STATS))
+    }
+    corrected = 0
+    for bucket in set(current) | set(expected):
+        value = expected.get(bucket, 0)
+        counter = current.get(bucket)
+        if counter is None:
+            if value:
+                db.session.add(StatCounter(name=bucket[0], key=bucket[1], value=value))
+                corrected += 1
+        elif counter.value != value:
+            counter.value = value
+            corrected += 1
+    db.session.commit()
+    return corrected
+
+
+def get_counters(name):
+    """Return all counters for a statistic as a key -> value dict"""
+    return {counter.key: counter.value for counter in StatCounter.query.filter_by(name=name)}
+
+
+def get_signups_per_day(days=30):
+    """Return signups per day for the last `days` days, including empty days"""
+    # Counters are keyed by UTC dates, since created_at is datetime.utcnow()
+    start = datetime.utcnow().date() - timedelta(days=days - 1)
+    counters = StatCounter.query.filter(
+        StatCounter.name == 'signups_per_day',
+        StatCounter.key >= start.isoformat(),
+    )
+    values = {counter.key: counter.value for counter in counters}
+    signups = {}
+    for offset in range(days):
+        key = (start + timedelta(days=offset)).isoformat()
+        signups[key] = values.get(key, 0)
+    return signups
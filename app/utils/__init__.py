@@ -2,6 +2,8 @@ from app.utils.security import admin_required, teacher_required, get_current_use
 from app.utils.helpers import allowed_file, save_file, paginate
 from app.utils.validators import validate_email
 from app.utils.error_handlers import register_error_handlers
+from app.utils.compression import register_compression
+from app.utils.cache import response_cache
 
 __all__ = [
     'admin_required',
@@ -11,5 +13,7 @@ __all__ = [
     'save_file',
     'paginate',
     'validate_email',
-    'register_error_handlers'
+    'register_error_handlers',
+    'register_compression',
+    'response_cache'
 ]
\ No newline at end of file
@@ -0,0 +1,204 @@
+# /backend/app/utils/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, make_response, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from sqlalchemy import event
+
+from app import db
+from app.models.user import User
+
+# Session.info keys used to tie invalidation to the database transaction
+_PENDING_TAGS = 'response_cache_pending_tags'
+_UNCOMMITTED_WRITES = 'response_cache_uncommitted_writes'
+
+class ResponseCache:
+    """In-process LRU cache for GET responses, bounded by total body size.
+
+    Entries are keyed on path, query string and the caller's role, and can be
+    tagged so write handlers purge only the entries their change affects.
+    Invalidation runs when the session commits. The cache is per process, so
+    entries also expire after RESPONSE_CACHE_TTL seconds; that bounds how long
+    other workers can serve a response after a write they did not see.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._tags = {}
+        self._size = 0
+        self._generation = 0
+        self.max_bytes = 32 * 1024 * 1024
+        self.ttl = 60
+        self.hits = 0
+        self.misses = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault('RESPONSE_CACHE_MAX_BYTES', self.max_bytes)
+        app.config.setdefault('RESPONSE_CACHE_TTL', self.ttl)
+        self.max_bytes = app.config['RESPONSE_CACHE_MAX_BYTES']
+        self.ttl = app.config['RESPONSE_CACHE_TTL']
+        app.extensions['response_cache'] = self
+
+        hooks = [
+            ('after_flush', _after_flush),
+            ('after_commit', self._after_commit),
+            ('after_rollback', _after_rollback),
+        ]
+        for identifier, fn in hooks:
+            if not event.contains(db.session, identifier, fn):
+                event.listen(db.session, identifier, fn)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[4] <= time.monotonic():
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, body, status, headers, tags=(), generation=None):
+        """Store a response; skipped if an invalidation ran since `generation`"""
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._discard(key)
+            self._entries[key] = (body, status, headers, tuple(tags), time.monotonic() + self.ttl)
+            self._size += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, *tags):
+        """Drop every entry carrying any of the given tags right away"""
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._discard(key)
+
+    def invalidate_on_commit(self, *tags):
+        """Drop entries carrying these tags once the current session commits.
+
+        Call it before db.session.commit() in write handlers. If the
+        transaction rolls back instead, nothing is invalidated.
+        """
+        db.session.info.setdefault(_PENDING_TAGS, set()).update(tags)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        body, _, _, tags, _ = entry
+        self._size -= len(body)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _after_commit(self, session):
+        session.info.pop(_UNCOMMITTED_WRITES, None)
+        tags = session.info.pop(_PENDING_TAGS, None)
+        if tags:
+            self.invalidate(*tags)
+
+    def cached(self, tags=()):
+        """
+        Cache successful GET responses of a view.
+
+        Only use it on endpoints whose response depends on nothing but the
+        path, the query string and the caller's role.
+
+        Args:
+            tags: Iterable of tags, or a callable receiving the view's keyword
+                arguments and returning them, used for invalidation.
+        """
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                # Inside a transaction with unflushed or uncommitted writes
+                # (e.g. a transactional batch) the cache is neither read nor
+                # written, so the caller sees its own changes and nothing
+                # that may still roll back is stored.
+                if request.method != 'GET' or _has_uncommitted_writes():
+                    return fn(*args, **kwargs)
+
+                key = (request.path, request.query_string, _current_role())
+                entry = self.get(key)
+                if entry is not None:
+                    body, status, headers, _, _ = entry
+                    response = current_app.response_class(body, status=status, headers=headers)
+                    response.headers['X-Cache'] = 'HIT'
+                    return response
+
+                generation = self._generation
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    entry_tags = tags(**kwargs) if callable(tags) else tags
+                    headers = [(name, value) for name, value in response.headers
+                               if name in ('Content-Type', 'Link', 'X-Pagination')]
+                    self.set(key, response.get_data(), response.status_code, headers,
+                             entry_tags, generation=generation)
+                response.headers['X-Cache'] = 'MISS'
+                return response
+            return wrapper
+        return decorator
+
+def _after_flush(session, flush_context):
+    session.info[_UNCOMMITTED_WRITES] = True
+
+def _after_rollback(session):
+    session.info.pop(_UNCOMMITTED_WRITES, None)
+    session.info.pop(_PENDING_TAGS, None)
+
+def _has_uncommitted_writes():
+    """True if the session holds changes another request could not see yet"""
+    session = db.session
+    return bool(session.new or session.dirty or session.deleted
+                or session.info.get(_UNCOMMITTED_WRITES))
+
+def _current_role():
+    """Role of the caller, from the verified JWT"""
+    verify_jwt_in_request(optional=True)
+    identity = get_jwt_identity()
+    if identity is None:
+        return 'anonymous'
+    user = User.query.get(int(identity))
+    return user.role if user else 'anonymous'
+
+response_cache = ResponseCache()
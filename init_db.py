@@ -1,11 +1,14 @@
 from app import create_app, db
 from app.models.user import User
+from app.services.stats_service import reconcile_stats
 
 def init_database():
     app = create_app('development')
     with app.app_context():
         # Create all tables
         db.create_all()
+        # Fill the statistics counters for users created before they existed
+        reconcile_stats()
         
         # Check if admin already exists
         admin = User.query.filter_by(email='admin@example.com').first()
@@ -0,0 +1,40 @@
+import pytest
+
+from app import create_app, db
+from app.models.user import User
+from app.services.activity_service import activity_tracker
+from app.utils.cache import response_cache
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    app = create_app("testing")
+    app.config["TESTING"] = True
+    app.config["ACTIVITY_FLUSH_INTERVAL"] = 3600
+    with app.app_context():
+        db.create_all()
+        admin = User(email="admin@example.com", first_name="Admin", last_name="User", role="admin")
+        admin.password = "admin123"
+        student = User(email="student@example.com", first_name="S", last_name="Student")
+        student.password = "student123"
+        other = User(email="other@example.com", first_name="O", last_name="Other")
+        other.password = "other123"
+        db.session.add_all([admin, student, other])
+        db.session.commit()
+    response_cache.clear()
+    yield app
+    # The shared tracker buffers logins; write them while the database exists
+    activity_tracker.flush()
+    response_cache.clear()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_headers(client):
+    response = client.post("/api/auth/login", json={"email": "admin@example.com", "password": "admin123"})
+    return {"Authorization": f"Bearer {response.get_json()['access_token']}"}
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+import pytest
+
+from app import db
+from app.models.user import User
+from app.services.activity_service import ActivityTracker
+
+
+@pytest.fixture
+def tracker(app):
+    tracker = ActivityTracker(app)
+    # Keep the background worker from racing the assertions
+    tracker._stopped = True
+    return tracker
+
+
+def _last_login(app, user_id):
+    with app.app_context():
+        return db.session.get(User, user_id).last_login
+
+
+def test_record_is_buffered_until_flush(app, tracker):
+    timestamp = datetime(2026, 1, 1, 12, 0)
+    tracker.record(2, "last_login", timestamp)
+
+    assert _last_login(app, 2) is None
+    assert tracker.flush() == 1
+    assert _last_login(app, 2) == timestamp
+
+
+def test_newest_timestamp_per_user_wins(app, tracker):
+    tracker.record(2, "last_login", datetime(2026, 1, 2))
+    tracker.record(2, "last_login", datetime(2026, 1, 1))
+    tracker.record(3, "last_login", datetime(2026, 1, 3))
+
+    assert tracker.flush() == 2
+    assert _last_login(app, 2) == datetime(2026, 1, 2)
+    assert _last_login(app, 3) == datetime(2026, 1, 3)
+
+
+def test_empty_flush_keeps_metrics(tracker):
+    tracker.record(2)
+    tracker.flush()
+
+    assert tracker.flush() == 0
+    metrics = tracker.metrics()
+    assert metrics["last_batch_size"] == 1
+    assert metrics["flush_count"] == 1
+    assert metrics["total_flushed"] == 1
+
+
+def test_failed_flush_requeues(app, tracker, monkeypatch):
+    timestamp = datetime(2026, 1, 1)
+    tracker.record(2, "last_login", timestamp)
+
+    def failing_write(pending):
+        raise RuntimeError("database unavailable")
+    monkeypatch.setattr(tracker, "_write", failing_write)
+    with pytest.raises(RuntimeError):
+        tracker.flush()
+    assert tracker.metrics()["pending"] == 1
+    assert tracker.metrics()["flush_count"] == 0
+
+    monkeypatch.undo()
+    assert tracker.flush() == 1
+    assert _last_login(app, 2) == timestamp
+
+
+def test_unknown_column_is_rejected(tracker):
+    with pytest.raises(ValueError):
+        tracker.record(2, "password_hash")
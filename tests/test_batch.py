@@ -0,0 +1,107 @@
+from flask_sqlalchemy.session import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.user import User
+
+
+def _names(app):
+    with app.app_context():
+        return {user.id: user.first_name for user in User.query.all()}
+
+
+def test_batch_runs_sub_requests(client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"requests": [
+        {"path": "/api/users/me?fields=email"},
+        {"path": "/api/users/2"},
+        {"path": "/api/missing"},
+    ]})
+
+    assert response.status_code == 200
+    statuses = [item["status"] for item in response.get_json()["responses"]]
+    assert statuses == [200, 200, 404]
+    assert response.get_json()["responses"][0]["body"] == {"email": "admin@example.com"}
+
+
+def test_transactional_batch_rolls_back_on_failure(app, client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"method": "PUT", "path": "/api/users/2", "body": {"first_name": "Changed"}},
+        {"method": "POST", "path": "/api/users/", "body": {
+            "email": "other@example.com", "password": "secret1", "first_name": "X", "last_name": "Y"}},
+    ]})
+
+    body = response.get_json()
+    assert body["committed"] is False
+    assert [item["status"] for item in body["responses"]] == [200, 409]
+    assert _names(app)[2] == "S"
+
+
+def test_transactional_batch_commits_all(app, client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"method": "PUT", "path": "/api/users/2", "body": {"first_name": "Two"}},
+        {"method": "PUT", "path": "/api/users/3", "body": {"first_name": "Three"}},
+    ]})
+
+    assert response.get_json()["committed"] is True
+    names = _names(app)
+    assert names[2] == "Two" and names[3] == "Three"
+
+
+def test_transactional_batch_fails_when_handler_rolls_back(app, client, admin_headers, monkeypatch):
+    # UserView.delete swallows the error, rolls back and still returns 204
+    def failing_delete(session, instance):
+        raise SQLAlchemyError("delete failed")
+    monkeypatch.setattr(Session, "delete", failing_delete)
+
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"method": "PUT", "path": "/api/users/2", "body": {"first_name": "Changed"}},
+        {"method": "DELETE", "path": "/api/users/3"},
+        {"method": "PUT", "path": "/api/users/3", "body": {"first_name": "Changed"}},
+    ]})
+    monkeypatch.undo()
+
+    body = response.get_json()
+    assert body["committed"] is False
+    assert [item["status"] for item in body["responses"]] == [200, 204]
+    names = _names(app)
+    assert names[2] == "S" and names[3] == "O"
+
+
+def test_transactional_batch_treats_redirect_as_failure(client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"path": "/api/users"},
+    ]})
+
+    body = response.get_json()
+    assert body["committed"] is False
+    assert body["responses"][0]["status"] == 308
+
+
+def test_nested_batch_is_rejected(client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"requests": [
+        {"method": "POST", "path": "/api/%62atch/", "body": {"requests": [{"path": "/api/users/me"}]}},
+    ]})
+
+    item = response.get_json()["responses"][0]
+    assert item["status"] == 400
+    assert "nested" in item["body"]["message"]
+
+
+def test_nested_batch_does_not_end_outer_transaction(app, client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"method": "PUT", "path": "/api/users/2", "body": {"first_name": "Changed"}},
+        {"method": "POST", "path": "/api/batch/", "body": {"transactional": True, "requests": [
+            {"path": "/api/users/me"}]}},
+        {"method": "PUT", "path": "/api/users/3", "body": {"first_name": "Changed"}},
+    ]})
+
+    assert response.get_json()["committed"] is False
+    names = _names(app)
+    assert names[2] == "S" and names[3] == "O"
+
+
+def test_batch_size_is_capped(client, admin_headers, app):
+    app.config["BATCH_MAX_REQUESTS"] = 2
+    response = client.post("/api/batch/", headers=admin_headers, json={"requests": [
+        {"path": "/api/users/me"}] * 3})
+
+    assert response.status_code == 400
@@ -0,0 +1,85 @@
+import time
+
+from app.utils.cache import ResponseCache, response_cache
+
+
+def _list(client, headers):
+    response = client.get("/api/users/", headers=headers)
+    names = {user["id"]: user["first_name"] for user in response.get_json()}
+    return response.headers["X-Cache"], names
+
+
+def test_repeated_get_is_a_hit(client, admin_headers):
+    assert _list(client, admin_headers)[0] == "MISS"
+    assert _list(client, admin_headers)[0] == "HIT"
+
+
+def test_write_invalidates_on_commit(client, admin_headers):
+    _list(client, admin_headers)
+    client.put("/api/users/2", headers=admin_headers, json={"first_name": "Changed"})
+
+    status, names = _list(client, admin_headers)
+    assert status == "MISS"
+    assert names[2] == "Changed"
+
+
+def test_committed_transactional_batch_invalidates(client, admin_headers):
+    _list(client, admin_headers)
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"method": "PUT", "path": "/api/users/2", "body": {"first_name": "Changed"}},
+        {"path": "/api/users/"},
+    ]})
+    body = response.get_json()
+    assert body["committed"] is True
+    # The GET inside the batch sees its own uncommitted write
+    assert {user["id"]: user["first_name"] for user in body["responses"][1]["body"]}[2] == "Changed"
+
+    status, names = _list(client, admin_headers)
+    assert status == "MISS"
+    assert names[2] == "Changed"
+
+
+def test_rolled_back_batch_is_never_cached(client, admin_headers):
+    response = client.post("/api/batch/", headers=admin_headers, json={"transactional": True, "requests": [
+        {"method": "PUT", "path": "/api/users/2", "body": {"first_name": "Changed"}},
+        {"path": "/api/users/"},
+        {"method": "POST", "path": "/api/users/", "body": {
+            "email": "other@example.com", "password": "secret1", "first_name": "X", "last_name": "Y"}},
+    ]})
+    assert response.get_json()["committed"] is False
+
+    status, names = _list(client, admin_headers)
+    assert status == "MISS"
+    assert names[2] == "S"
+    assert _list(client, admin_headers) == ("HIT", names)
+
+
+def test_entries_expire_after_ttl(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(response_cache, "ttl", 0.05)
+    _list(client, admin_headers)
+    time.sleep(0.1)
+
+    assert _list(client, admin_headers)[0] == "MISS"
+
+
+def test_invalidation_during_request_skips_store():
+    cache = ResponseCache()
+    generation = cache._generation
+    cache.invalidate("users")
+    cache.set("key", b"body", 200, [], ("users",), generation=generation)
+
+    assert cache.get("key") is None
+
+
+def test_lru_eviction_and_tags():
+    cache = ResponseCache()
+    cache.max_bytes = 10
+    cache.set("a", b"1234", 200, [], ("t1",))
+    cache.set("b", b"1234", 200, [], ("t2",))
+    cache.get("a")
+    cache.set("c", b"1234", 200, [], ("t1",))
+
+    assert cache.get("b") is None
+    cache.invalidate("t1")
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
@@ -0,0 +1,107 @@
+from datetime import datetime
+
+from app import db
+from app.models.stat_counter import StatCounter
+from app.models.user import User
+from app.services.stats_service import get_counters, get_signups_per_day, reconcile_stats
+
+
+def _new_user(email, role="student"):
+    user = User(email=email, first_name="N", last_name="User", role=role)
+    user.password = "secret123"
+    return user
+
+
+def test_insert_updates_counters(app):
+    with app.app_context():
+        db.session.add(_new_user("new@example.com"))
+        db.session.commit()
+
+        assert get_counters("users") == {"total": 4}
+        assert get_counters("users_by_role") == {"admin": 1, "student": 3}
+        assert get_counters("users_by_status") == {"active": 4}
+        today = datetime.utcnow().date().isoformat()
+        assert get_signups_per_day(1) == {today: 4}
+
+
+def test_role_change_moves_counter(app):
+    with app.app_context():
+        user = db.session.get(User, 2)
+        user.role = "admin"
+        db.session.commit()
+
+        assert get_counters("users_by_role") == {"admin": 2, "student": 1}
+        assert get_counters("users") == {"total": 3}
+
+
+def test_update_after_expire_uses_old_value(app):
+    with app.app_context():
+        user = db.session.get(User, 2)
+        db.session.expire(user)
+        user.is_active = False
+        db.session.commit()
+        assert get_counters("users_by_status") == {"active": 2, "inactive": 1}
+
+        # commit() expires everything as well
+        user.role = "admin"
+        db.session.commit()
+        assert get_counters("users_by_role") == {"admin": 2, "student": 1}
+
+
+def test_delete_updates_counters(app):
+    with app.app_context():
+        db.session.delete(db.session.get(User, 3))
+        db.session.commit()
+
+        assert get_counters("users") == {"total": 2}
+        assert get_counters("users_by_role") == {"admin": 1, "student": 1}
+
+
+def test_rollback_discards_counter_changes(app):
+    with app.app_context():
+        db.session.add(_new_user("new@example.com"))
+        db.session.flush()
+        db.session.rollback()
+
+        assert get_counters("users") == {"total": 3}
+
+
+def test_reconcile_reports_only_real_drift(app):
+    with app.app_context():
+        user = db.session.get(User, 2)
+        user.is_active = False
+        db.session.commit()
+        user.is_active = True
+        db.session.commit()
+        assert get_counters("users_by_status") == {"active": 3, "inactive": 0}
+
+        assert reconcile_stats() == 0
+
+        counter = db.session.get(StatCounter, ("users", "total"))
+        counter.value = 99
+        db.session.commit()
+        assert reconcile_stats() == 1
+        assert get_counters("users") == {"total": 3}
+
+
+def test_init_db_backfills_counters(app):
+    with app.app_context():
+        StatCounter.query.delete()
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["init-db"])
+
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert get_counters("users") == {"total": 3}
+        assert get_counters("users_by_role") == {"admin": 1, "student": 2}
+
+
+def test_stats_endpoints_require_admin(client, admin_headers):
+    response = client.get("/api/admin/stats/users", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.get_json()["total"] == 3
+
+    login = client.post("/api/auth/login", json={"email": "student@example.com", "password": "student123"})
+    student_headers = {"Authorization": f"Bearer {login.get_json()['access_token']}"}
+    assert client.get("/api/admin/stats/users", headers=student_headers).status_code == 403